@@ -6,6 +6,8 @@ keyboard_page = st.Page('keyboard_control.py', title='Keyboard Controls', icon="
 voice_page    = st.Page('voice_control.py',   title='Voice Control',     icon=":material/record_voice_over:")
 image_page    = st.Page('image_control.py',   title='Image Control',     icon=":material/image:")
 pose_page     = st.Page('pose_control.py',    title='Pose Control',      icon=":material/accessibility_new:")
+bench_page    = st.Page('model_benchmark.py', title='Model Benchmark',   icon=":material/speed:")
 
-pg = st.navigation({"Control Modes": [keyboard_page, voice_page, image_page, pose_page]})
+pg = st.navigation({"Control Modes": [keyboard_page, voice_page, image_page, pose_page],
+                    "Tools": [bench_page]})
 pg.run()
@@ -0,0 +1,550 @@
+import ast, os, json
+import streamlit as st
+
+# ========== CONFIG ==========
+PAGES = {                               # control page each model is configured in
+    "Image": "image_control.py",
+    "Voice": "voice_control.py",
+    "Pose":  "pose_control.py",
+}
+MEDIA_TYPES = {
+    "Image": ["png", "jpg", "jpeg", "webp"],
+    "Voice": ["wav", "mp3", "ogg", "webm"],
+    "Pose":  ["png", "jpg", "jpeg", "webp"],
+}
+SAMPLE_MS = {"Image": 33, "Voice": 500, "Pose": 33}   # default spacing of recorded samples
+# ============================
+
+
+def page_config(filename):
+    """Read the literal CONFIG constants (MODEL_ID, VIDEO_W, ...) of a control page without running it."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename)
+    out = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            continue                    # f-strings etc.
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                out[target.id] = value
+            elif isinstance(target, ast.Tuple) and isinstance(value, tuple) and len(value) == len(target.elts):
+                out.update({t.id: v for t, v in zip(target.elts, value) if isinstance(t, ast.Name)})
+    return out
+
+
+def join(values):
+    return ", ".join(str(v) for v in dict.fromkeys(values))
+
+
+st.title("📊 Model Benchmark")
+st.caption("Replay recorded samples through the Teachable Machine models to tune thresholds, throttles and camera sizes offline")
+
+mode = st.radio("Model", list(PAGES), horizontal=True)
+page = page_config(PAGES[mode])
+model_id = st.text_input("MODEL_ID", page.get("MODEL_ID", ""), help=f"Defaults to the id configured in {PAGES[mode]}")
+st.markdown(
+    "Pick samples named like `F_0001.jpg` (label prefix), or add one CSV manifest with "
+    "`file,label[,t_ms]` columns. Files are read by the browser and never uploaded. "
+    "Inference runs once per resolution; threshold, throttle and spacing changes only redo the replay."
+)
+
+cfg = {
+    "mode": mode,
+    "modelUrl": f"https://teachablemachine.withgoogle.com/models/{model_id}/",
+    "accept": ",".join("." + ext for ext in MEDIA_TYPES[mode] + ["csv"]),
+    "sizes": "" if mode == "Voice" else join([f"{page['VIDEO_W']}x{page['VIDEO_H']}", "320x240", "160x120"]),
+    "thresholds": join([page.get("PROB_THRESHOLD", 0), 0, 0.5, 0.75, 0.9]),
+    "intervals": join([page.get("SEND_INTERVAL_MS", page.get("INTERVAL_MS", 500)), 250, 500, 1000]),
+    "sampleMs": SAMPLE_MS[mode],
+    "batchSize": 16,
+}
+cfg_json = json.dumps(cfg).replace("</", "<\\/")      # keep "</script>" in values from closing the tag
+
+scripts = {
+    "Image": """<script src="https://cdn.jsdelivr.net/npm/@tensorflow/tfjs@4"></script>
+<script src="https://cdn.jsdelivr.net/npm/@teachablemachine/image@0.8/dist/teachablemachine-image.min.js"></script>""",
+    "Voice": """<script src="https://cdn.jsdelivr.net/npm/@tensorflow/tfjs@1.3.1/dist/tf.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/@tensorflow-models/speech-commands@0.4.0/dist/speech-commands.min.js"></script>""",
+    "Pose": """<script src="https://cdn.jsdelivr.net/npm/@tensorflow/tfjs@1.3.1/dist/tf.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/@teachablemachine/pose@0.8/dist/teachablemachine-pose.min.js"></script>""",
+}
+
+# Voice batches recognize() calls; Image/Pose models take one frame at a time, so there
+# the field only sets how many frames are decoded between UI yields.
+batch_label = "Batch size (throughput column only)" if mode == "Voice" else "Frames decoded per step"
+
+camera_inputs = "" if mode == "Voice" else """
+    <label>Input resolutions (WxH)<input id="sizes"></label>
+    <label style="justify-content:flex-end;"><span><input type="checkbox" id="mirror" checked> Mirror frames like the live webcam</span></label>"""
+
+html = f"""
+<style>
+  table {{ border-collapse:collapse; margin:10px 0 18px; font-size:13px; font-variant-numeric:tabular-nums; }}
+  th, td {{ padding:4px 10px; border-bottom:1px solid rgba(255,255,255,.12); text-align:right; }}
+  th {{ opacity:.8; }}
+  .grid {{ display:grid; grid-template-columns:1fr 1fr; gap:10px 18px; margin:12px 0; font-size:13px; }}
+  .grid label {{ display:flex; flex-direction:column; gap:4px; opacity:.9; }}
+</style>
+<div style="font-family:system-ui,Segoe UI,Roboto,Arial; color:#e5e7eb;">
+  <input type="file" id="files" multiple>
+  <div class="grid">{camera_inputs}
+    <label>PROB_THRESHOLD values<input id="thresholds"></label>
+    <label>Throttle values (ms)<input id="intervals"></label>
+    <label>Spacing between samples without t_ms (ms)<input id="spacing" type="number" min="1"></label>
+    <label>{batch_label}<input id="batch" type="number" min="1" max="256"></label>
+  </div>
+  <button id="run" style="padding:10px 16px;border-radius:10px;">Run Benchmark</button>
+  <a id="csv" style="margin-left:12px; color:#a3e635; display:none;" download="benchmark.csv">Download CSV</a>
+  <div id="status" style="margin:10px 0;font-weight:600;">Idle</div>
+  <div id="results"></div>
+</div>
+
+<!-- TF.js + Teachable Machine -->
+{scripts[mode]}
+
+<script>
+const CFG = {cfg_json};
+const $ = id => document.getElementById(id);
+
+let model = null;          // loaded once per page
+let samples = [];          // [{{file, name, label, tMs}}] in timeline order
+let spectrograms = null;   // Voice: one input per sample (null for silent clips)
+let predCache = {{}};      // "WxH|mirror" (or "audio|batch") -> {{preds: [{{label, prob, ms, silent}}], batchRate}}
+
+function setStatus(s) {{
+  const el = $("status");
+  if (el) el.innerText = s;
+}}
+
+function parseList(text, conv) {{
+  const items = [];
+  for (const part of text.split(/[,;]/)) {{
+    if (!part.trim()) continue;
+    const v = conv(part.trim());
+    if (!items.some(x => JSON.stringify(x) === JSON.stringify(v))) items.push(v);
+  }}
+  if (!items.length) throw new Error("empty list");
+  return items;
+}}
+
+function parseNumber(text) {{
+  const v = Number(text);
+  if (text === "" || isNaN(v)) throw new Error("not a number: " + text);
+  return v;
+}}
+
+function parseSize(text) {{
+  const m = text.toLowerCase().split("x").map(Number);
+  if (m.length !== 2 || !(m[0] > 0) || !(m[1] > 0)) throw new Error("not a WxH size: " + text);
+  return m;
+}}
+
+// Minimal RFC 4180 reader: quoted fields, doubled quotes, CRLF.
+function parseCsv(text) {{
+  const rows = [];
+  let row = [], field = "", quoted = false;
+  text = text.replace(/^\\uFEFF/, "").split("\\r").join("");
+  for (let i = 0; i <= text.length; i++) {{
+    const c = text[i];
+    if (quoted) {{
+      if (c === '"' && text[i + 1] === '"') {{ field += '"'; i++; }}
+      else if (c === '"') quoted = false;
+      else if (c !== undefined) field += c;
+    }} else if (c === '"') quoted = true;
+    else if (c === ",") {{ row.push(field); field = ""; }}
+    else if (c === "\\n" || c === undefined) {{
+      row.push(field); field = "";
+      if (row.some(f => f.trim())) rows.push(row);
+      row = [];
+    }} else field += c;
+  }}
+  return rows;
+}}
+
+function isCsv(f) {{ return f.name.toLowerCase().endsWith(".csv"); }}
+
+function stem(name) {{
+  const dot = name.lastIndexOf(".");
+  return dot > 0 ? name.slice(0, dot) : name;
+}}
+
+// Ground truth comes from the CSV manifest when present (every selected file needs a
+// row with a label), otherwise from the file name prefix before the first "_"
+// (e.g. "F_0001.jpg" -> "F"). t_ms must be set on all selected rows or on none;
+// without it samples are spaced evenly in name order.
+async function loadSamples(fileList) {{
+  const files = Array.from(fileList);
+  const manifests = files.filter(isCsv);
+  const media = files.filter(f => !isCsv(f)).sort((a, b) => a.name < b.name ? -1 : a.name > b.name ? 1 : 0);
+  if (manifests.length > 1) throw new Error("pick a single manifest, got " + manifests.map(f => f.name).join(", "));
+  if (!media.length) throw new Error("no media files selected");
+
+  let rows = null;
+  if (manifests.length) {{
+    const [head, ...body] = parseCsv(await manifests[0].text());
+    const col = {{}};
+    (head || []).forEach((h, i) => col[h.trim()] = i);
+    if (col.file === undefined || col.label === undefined) throw new Error("manifest needs file and label columns");
+    rows = {{}};
+    for (const r of body) {{
+      rows[(r[col.file] || "").trim()] = {{
+        label: r[col.label] || "",
+        t: col.t_ms === undefined ? "" : (r[col.t_ms] || "").trim(),
+      }};
+    }}
+    const missing = media.filter(f => !rows[f.name]).map(f => f.name);
+    if (missing.length) throw new Error("manifest has no row for " + missing.join(", "));
+    const unlabelled = media.filter(f => !rows[f.name].label.trim()).map(f => f.name);
+    if (unlabelled.length) throw new Error("manifest row for " + unlabelled.join(", ") + " has no label");
+    const timed = media.map(f => rows[f.name].t !== "");
+    if (timed.some(x => x) && !timed.every(x => x)) throw new Error("t_ms must be set on every selected manifest row or on none");
+  }}
+
+  const out = media.map(f => {{
+    const row = rows && rows[f.name];
+    const label = (row ? row.label : stem(f.name).split("_")[0]).trim().toUpperCase();
+    return {{ file: f, name: f.name, label, tMs: row && row.t !== "" ? parseNumber(row.t) : null }};
+  }});
+  if (out[0].tMs !== null) out.sort((a, b) => a.tMs - b.tMs);
+  return out;
+}}
+
+function timeline(spacing) {{
+  return samples.map((s, i) => s.tMs !== null ? s.tMs : i * spacing);
+}}
+
+async function decodeImage(s) {{
+  try {{ return await createImageBitmap(s.file); }}
+  catch (err) {{ throw new Error("cannot decode image " + s.name); }}
+}}
+
+function top1(items) {{
+  let best = items[0];
+  for (const it of items) if (it.probability > best.probability) best = it;
+  return {{ label: (best.className || "").trim().toUpperCase(), prob: best.probability || 0 }};
+}}
+
+// Draw a frame the way tm*.Webcam does: scaled to CAM_W x CAM_H, optionally mirrored.
+function drawFrame(canvas, img, flip) {{
+  const ctx = canvas.getContext("2d");
+  ctx.setTransform(1, 0, 0, 1, 0, 0);
+  if (flip) {{ ctx.translate(canvas.width, 0); ctx.scale(-1, 1); }}
+  ctx.drawImage(img, 0, 0, canvas.width, canvas.height);
+}}
+
+// Offline equivalent of the recognizer's BROWSER_FFT feature extractor:
+// render the clip through an AnalyserNode and snapshot one FFT frame per fftSize samples.
+// Like the live extractor, frames that come back as -Infinity (digital silence) are
+// skipped; clips without numFrames usable frames return null and are never published.
+async function spectrogram(file, recognizer) {{
+  const {{ sampleRateHz, fftSize }} = recognizer.params();
+  const [, numFrames, numBins] = recognizer.modelInputShape();
+  const data = await file.arrayBuffer();
+  const audio = await new OfflineAudioContext(1, 1, sampleRateHz).decodeAudioData(data);
+
+  const hops = Math.max(numFrames, Math.ceil(audio.length / fftSize));
+  const ctx = new OfflineAudioContext(1, (hops + 1) * fftSize, sampleRateHz);
+  const src = ctx.createBufferSource();
+  const analyser = ctx.createAnalyser();
+  analyser.fftSize = fftSize * 2;
+  analyser.smoothingTimeConstant = 0;
+  src.buffer = audio;
+  src.connect(analyser);
+  analyser.connect(ctx.destination);
+
+  const out = new Float32Array(numFrames * numBins);
+  const freq = new Float32Array(analyser.frequencyBinCount);
+  let frames = 0;
+  for (let k = 0; k < hops; k++) {{
+    ctx.suspend((k + 1) * fftSize / sampleRateHz).then(() => {{
+      analyser.getFloatFrequencyData(freq);
+      if (frames < numFrames && freq[0] !== -Infinity) {{
+        for (let j = 0; j < numBins; j++) {{
+          out[frames * numBins + j] = isFinite(freq[j]) ? freq[j] : analyser.minDecibels;
+        }}
+        frames++;
+      }}
+      ctx.resume();
+    }});
+  }}
+  src.start(0);
+  await ctx.startRendering();
+  if (frames < numFrames) return null;
+
+  // Same per-example normalization the recognizer applies to streamed input.
+  let mean = 0, sq = 0;
+  for (const v of out) mean += v;
+  mean /= out.length;
+  for (const v of out) sq += (v - mean) * (v - mean);
+  const std = Math.sqrt(sq / out.length) || 1;
+  for (let i = 0; i < out.length; i++) out[i] = (out[i] - mean) / std;
+  return out;
+}}
+
+async function loadModel() {{
+  const modelURL = CFG.modelUrl + "model.json";
+  const metadataURL = CFG.modelUrl + "metadata.json";
+  if (CFG.mode === "Image") return await tmImage.load(modelURL, metadataURL);
+  if (CFG.mode === "Pose")  return await tmPose.load(modelURL, metadataURL);
+  const recognizer = speechCommands.create("BROWSER_FFT", undefined, modelURL, metadataURL);
+  await recognizer.ensureModelLoaded();
+  return recognizer;
+}}
+
+async function predictFrame(canvas) {{
+  if (CFG.mode === "Image") return top1(await model.predict(canvas));
+  const {{ posenetOutput }} = await model.estimatePose(canvas);
+  return top1(await model.predict(posenetOutput));
+}}
+
+// Returns one {{label, prob, ms}} per sample; ms is the per-inference latency.
+// Frames are decoded one batch at a time so large recordings never sit in memory at once.
+async function runImages(size, mirror, batchSize) {{
+  const canvas = document.createElement("canvas");
+  [canvas.width, canvas.height] = size;
+  const first = await decodeImage(samples[0]);
+  drawFrame(canvas, first, mirror);
+  await predictFrame(canvas);                            // warm-up (shader compile)
+  first.close();
+
+  const preds = [];
+  for (let b = 0; b < samples.length; b += batchSize) {{
+    const bitmaps = await Promise.all(samples.slice(b, b + batchSize).map(decodeImage));
+    for (const bitmap of bitmaps) {{
+      const t0 = performance.now();
+      drawFrame(canvas, bitmap, mirror);
+      const p = await predictFrame(canvas);
+      p.ms = performance.now() - t0;
+      preds.push(p);
+      bitmap.close();
+    }}
+    setStatus(`${{size[0]}}x${{size[1]}}: ${{preds.length}}/${{samples.length}}`);
+    await tf.nextFrame();
+  }}
+  return {{ preds, batchRate: null }};
+}}
+
+// Each clip is timed as a single-window recognize() call, like the live page, so
+// latency and the busy/drop replay match it. Batching is measured separately as
+// throughput only.
+async function runAudio(batchSize) {{
+  const labels = model.wordLabels();
+  const [, numFrames, numBins] = model.modelInputShape();
+  const frameLen = numFrames * numBins;
+  const warm = tf.zeros([1, numFrames, numBins, 1]);
+  await model.recognize(warm);                                      // warm-up
+  warm.dispose();
+
+  const preds = [];
+  for (let b = 0; b < spectrograms.length; b += batchSize) {{
+    for (const spec of spectrograms.slice(b, b + batchSize)) {{
+      if (!spec) {{ preds.push({{ label: "", prob: 0, ms: 0, silent: true }}); continue; }}
+      const t0 = performance.now();
+      const x = tf.tensor4d(spec, [1, numFrames, numBins, 1]);
+      const {{ scores }} = await model.recognize(x);
+      x.dispose();
+      const ms = performance.now() - t0;
+      let top = 0;
+      for (let i = 1; i < scores.length; i++) if (scores[i] > scores[top]) top = i;
+      preds.push({{ label: labels[top].trim().toUpperCase(), prob: scores[top], ms }});
+    }}
+    setStatus(`audio: ${{preds.length}}/${{spectrograms.length}}`);
+    await tf.nextFrame();
+  }}
+
+  const valid = spectrograms.filter(x => x);             // silent clips have no spectrogram
+  let batchMs = 0;
+  for (let b = 0; b < valid.length; b += batchSize) {{
+    const chunk = valid.slice(b, b + batchSize);
+    const flat = new Float32Array(chunk.length * frameLen);
+    chunk.forEach((x, i) => flat.set(x, i * frameLen));
+    const t0 = performance.now();
+    const x = tf.tensor4d(flat, [chunk.length, numFrames, numBins, 1]);
+    await model.recognize(x);
+    x.dispose();
+    batchMs += performance.now() - t0;
+    setStatus(`audio batch ${{batchSize}}: ${{Math.min(b + batchSize, valid.length)}}/${{valid.length}}`);
+    await tf.nextFrame();
+  }}
+  return {{ preds, batchRate: 1000 * valid.length / batchMs }};
+}}
+
+// Replays the pages' maybePublish/publishIfNeeded gate over the recorded timeline.
+// The live loop runs one prediction at a time, so samples arriving while the
+// previous inference is still busy are dropped.
+function simulate(preds, times, threshold, interval) {{
+  let lastLabel = "", lastSent = -Infinity, busyUntil = -Infinity;
+  let dropped = 0, gated = 0, gatedOk = 0, sent = 0, wrong = 0;
+  samples.forEach((s, i) => {{
+    const p = preds[i], t = times[i];
+    if (t < busyUntil) {{ dropped++; return; }}
+    busyUntil = t + p.ms;
+    if (p.prob < threshold) return;
+    gated++;
+    if (p.label === s.label) gatedOk++;
+    if (p.label && (p.label !== lastLabel || t - lastSent > interval)) {{
+      sent++;
+      if (p.label !== s.label) wrong++;
+      lastLabel = p.label;
+      lastSent  = t;
+    }}
+  }});
+  return {{ dropped, gated, gatedOk, sent, wrong }};
+}}
+
+function percentile(sorted, q) {{
+  return sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+}}
+
+function table(headers, rows) {{
+  const th = headers.map(h => `<th>${{h}}</th>`).join("");
+  const tr = rows.map(r => "<tr>" + r.map(c => `<td>${{c}}</td>`).join("") + "</tr>").join("");
+  return `<table><tr>${{th}}</tr>${{tr}}</table>`;
+}}
+
+function batchSize() {{
+  return Math.max(1, Math.floor(parseNumber($("batch").value)));
+}}
+
+// Inference settings: one cache entry per (resolution, mirroring) for the current dataset;
+// Voice is keyed by batch size, the only mode where batching changes inference.
+function runs() {{
+  if (CFG.mode === "Voice") return [{{ key: `audio|${{batchSize()}}`, res: "–" }}];
+  const mirror = $("mirror").checked;
+  return parseList($("sizes").value, parseSize).map(size => ({{
+    key: `${{size[0]}}x${{size[1]}}|${{mirror}}`, res: `${{size[0]}}x${{size[1]}}`, size, mirror,
+  }}));
+}}
+
+// Pure post-processing of the cached predictions; never triggers inference.
+function render() {{
+  const results = $("results"), link = $("csv");
+  results.innerHTML = "";
+  link.style.display = "none";
+  if (!samples.length) return;
+
+  let settings, thresholds, intervals, spacing, batch;
+  try {{
+    settings = runs();
+    batch = batchSize();
+    thresholds = parseList($("thresholds").value, parseNumber);
+    intervals = parseList($("intervals").value, parseNumber);
+    spacing = parseNumber($("spacing").value);
+  }} catch (err) {{
+    setStatus("Settings error: " + err.message);
+    return;
+  }}
+  const times = timeline(spacing);
+  const n = samples.length;
+  const spanS = Math.max(times[times.length - 1] - times[0], 1) / 1000;   // times are in order
+  const perf = [], sweep = [], pending = [];
+
+  for (const run of settings) {{
+    if (!predCache[run.key]) {{ pending.push(run.res); continue; }}
+    const {{ preds, batchRate }} = predCache[run.key];
+    const lat = preds.filter(p => !p.silent).map(p => p.ms).sort((a, b) => a - b);
+    const total = lat.reduce((a, b) => a + b, 0);
+    const correct = preds.filter((p, i) => p.label === samples[i].label).length;
+    const row = [run.res, (100 * correct / n).toFixed(1) + "%", (1000 * lat.length / total).toFixed(1),
+                 (total / lat.length).toFixed(1), percentile(lat, 0.5).toFixed(1), percentile(lat, 0.95).toFixed(1)];
+    if (CFG.mode === "Voice") row.splice(3, 0, batchRate.toFixed(1));
+    perf.push(row);
+
+    for (const th of thresholds) {{
+      for (const iv of intervals) {{
+        const r = simulate(preds, times, th, iv);
+        sweep.push([run.res, th, iv, r.dropped, (100 * r.gated / n).toFixed(1) + "%",
+                    r.gated ? (100 * r.gatedOk / r.gated).toFixed(1) + "%" : "–",
+                    r.sent, r.wrong, (r.sent / spanS).toFixed(2)]);
+      }}
+    }}
+  }}
+
+  const silent = spectrograms ? spectrograms.filter(x => !x).length : 0;
+  let summary = `${{n}} samples over ${{spanS.toFixed(1)}} s`;
+  if (silent) summary += `, ${{silent}} clips too silent to recognize (scored as misses)`;
+  if (pending.length) summary += CFG.mode === "Voice" ? ` — press Run for batch ${{batch}}` : ` — press Run for ${{pending.join(", ")}}`;
+  results.innerHTML = `<div style="opacity:.8;">${{summary}}</div>`;
+  if (!perf.length) return;
+
+  const perfHead  = ["resolution", "accuracy", "inferences/s", "mean ms", "p50 ms", "p95 ms"];
+  if (CFG.mode === "Voice") perfHead.splice(3, 0, `inferences/s (batch ${{batch}})`);
+  const sweepHead = ["resolution", "threshold", "throttle ms", "dropped", "coverage", "accuracy ≥ threshold", "publishes", "wrong publishes", "publishes/s"];
+  results.innerHTML += table(perfHead, perf) + table(sweepHead, sweep);
+
+  const csvText = [sweepHead.concat(perfHead.slice(1)).join(",")]
+    .concat(sweep.map(r => r.concat(perf.find(p => p[0] === r[0]).slice(1)).join(",")))
+    .join("\\n");
+  if (link.href) URL.revokeObjectURL(link.href);
+  link.href = URL.createObjectURL(new Blob([csvText], {{ type: "text/csv" }}));
+  link.style.display = "inline";
+}}
+
+async function selectFiles() {{
+  samples = [];
+  spectrograms = null;
+  predCache = {{}};
+  try {{
+    samples = await loadSamples($("files").files);
+    const labels = [...new Set(samples.map(s => s.label))].sort();
+    setStatus(`${{samples.length}} samples, labels: ${{labels.join(", ")}}`);
+  }} catch (err) {{
+    setStatus("Dataset error: " + err.message);
+  }}
+  render();
+}}
+
+async function run() {{
+  const btn = $("run");
+  btn.disabled = true;
+  try {{
+    if (!samples.length) throw new Error("pick recorded samples first");
+    const settings = runs();
+    const batch = batchSize();
+
+    if (!model) {{
+      setStatus("Loading model...");
+      model = await loadModel();
+    }}
+    if (CFG.mode === "Voice" && !spectrograms) {{
+      setStatus("Decoding clips...");
+      const inputs = [];
+      for (const s of samples) inputs.push(await spectrogram(s.file, model));
+      if (inputs.every(x => !x)) throw new Error("no clip has enough non-silent audio for one recognizer window");
+      spectrograms = inputs;
+    }}
+    for (const r of settings) {{
+      if (predCache[r.key]) continue;
+      predCache[r.key] = CFG.mode === "Voice" ? await runAudio(batch) : await runImages(r.size, r.mirror, batch);
+    }}
+    render();
+    setStatus("Done ✔️");
+  }} catch (err) {{
+    setStatus("Benchmark error: " + (err?.message || err));
+    console.error(err);
+  }} finally {{
+    btn.disabled = false;
+  }}
+}}
+
+$("files").accept = CFG.accept;
+$("thresholds").value = CFG.thresholds;
+$("intervals").value = CFG.intervals;
+$("spacing").value = CFG.sampleMs;
+$("batch").value = CFG.batchSize;
+if ($("sizes")) $("sizes").value = CFG.sizes;
+
+$("files").addEventListener("change", selectFiles);
+for (const id of ["sizes", "mirror", "batch", "thresholds", "intervals", "spacing"]) {{
+  if ($(id)) $(id).addEventListener("change", render);
+}}
+$("run").addEventListener("click", run);
+</script>
+"""
+
+st.components.v1.html(html, height=900, scrolling=True)